@@ -42,22 +42,32 @@ Typical usage::
 __authors__ = ["Tsjerk A. Wassenaar"]
 __year__ = 2014
 
-# Read the version from a file to make sure
-# that it is consistent with the one in setup.py
-import os
-import copy
-import functools
-import __main__ as main
+import sys
 
-here = os.path.dirname(__file__)
-try:
-    with open(os.path.join(here, 'VERSION.txt'), encoding='UTF-8') as infile:
-        __version__ = infile.readline().strip()
-except FileNotFoundError:
-    __version__ = "unknown"
 
-del here
-del os
+def __getattr__(name):
+    """Load rarely used module attributes on first access.
+
+    ``__version__`` is read from VERSION.txt, to make sure that it is
+    consistent with the one in setup.py, but only when it is asked for.
+    Importing simopt therefore does not touch the file system.
+    """
+    if name == "__version__":
+        import os
+        here = os.path.dirname(__file__)
+        try:
+            with open(os.path.join(here, 'VERSION.txt'), encoding='UTF-8') as infile:
+                version = infile.readline().strip()
+        except FileNotFoundError:
+            version = "unknown"
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _program_name():
+    """Return the file name of the running program, or None if unknown."""
+    return getattr(sys.modules.get("__main__"), "__file__", None)
 
 
 # ---------------------------------------------------------------------------
@@ -134,11 +144,17 @@ class MissingMandatoryError(SimoptException):
         return "\n".join(msg)
 
 
+# Sentinel for the default program name of Usage, distinguishing "use the
+# running program" from an explicit None.
+_MAIN = object()
+
+
 class Usage(SimoptException):
     """Raised when the command-line invocation is incorrect.
 
-    Covers two cases:
-    - an unrecognised flag was given, or
+    Covers three cases:
+    - an unrecognised flag was given,
+    - an abbreviated long flag matches more than one option, or
     - a recognised flag did not receive the expected number of arguments.
 
     The message includes the program name (taken from ``__main__.__file__``
@@ -150,11 +166,13 @@ class Usage(SimoptException):
         A short description of what went wrong.
     program : str or None
         The program name to include in the error message.  Defaults to
-        ``__main__.__file__`` so that scripts automatically get their own
-        name in error output.
+        ``__main__.__file__``, looked up when the error is raised, so that
+        scripts automatically get their own name in error output.
     """
 
-    def __init__(self, msg, program=getattr(main, "__file__", None)):
+    def __init__(self, msg, program=_MAIN):
+        if program is _MAIN:
+            program = _program_name()
         if program:
             self.msg = f"{program}: {msg}\nTry '{program} --help' for more information."
         else:
@@ -287,6 +305,23 @@ class Options:
             option2tuple(i) for i in options if not isinstance(i, str)
         ])
 
+        # Build the prefix index used to resolve abbreviated long options.
+        # Every prefix of every "--" flag maps to the flags it may stand for,
+        # so resolving a token is a single lookup regardless of the number
+        # of options.  The bare "--" is left out: it never abbreviates a flag.
+        self._prefixes = {}
+        for flag in {*self._optiondict, "--help"}:
+            if flag.startswith("--"):
+                for end in range(3, len(flag) + 1):
+                    self._prefixes.setdefault(flag[:end], []).append(flag)
+
+        # Single-character boolean flags that may be bundled, as in "-vq".
+        self._bundled = {
+            flag[1]
+            for flag, val in self._optiondict.items()
+            if len(flag) == 2 and flag[0] == "-" and flag[1] != "-" and not val[2]
+        }
+
         # Initialise each option as an attribute on this object so that the
         # Options instance can be passed directly to functions that access
         # values as attributes rather than dict keys.
@@ -384,7 +419,7 @@ class Options:
         str
             The formatted help text, ready to print.
         """
-        out = [main.__file__ + "\n"]
+        out = [(_program_name() or "") + "\n"]
 
         if args is not None:
             parsed = self.parse(args, ignore_help=True)
@@ -401,13 +436,70 @@ class Options:
 
         return "\n".join(out) + "\n"
 
+    def _resolve(self, token):
+        """Resolve a command-line token to the option flag(s) it denotes.
+
+        Three forms are recognised besides an exact flag:
+
+        - ``--flag=value``, which carries its first argument inline;
+        - an unambiguous prefix of a long (``--``) flag, e.g. ``--out`` for
+          ``--output``;
+        - a bundle of single-character boolean flags, e.g. ``-vq`` for
+          ``-v -q``.
+
+        An exact match always takes precedence, so ``-dt`` is never read as
+        a bundle and ``--out`` is not ambiguous when it is itself a flag.
+
+        Parameters
+        ----------
+        token : str
+            A single argument string in flag position.
+
+        Returns
+        -------
+        list of tuple
+            ``(flag, inline)`` pairs, where ``inline`` is the value given
+            after ``=`` or ``None``.
+
+        Raises
+        ------
+        Usage
+            If the token is not recognised, is a prefix of more than one
+            long option, or gives an inline value to a flag that takes none.
+        """
+        if token in self._optiondict or token in ("-h", "--help"):
+            return [(token, None)]
+
+        if token.startswith("--"):
+            name, sep, value = token.partition("=")
+            if name not in self._optiondict and name != "--help":
+                candidates = self._prefixes.get(name, [])
+                if len(candidates) > 1:
+                    raise Usage(
+                        f"Ambiguous option '{name}' could be: "
+                        f"{', '.join(sorted(candidates))}"
+                    )
+                if not candidates:
+                    raise Usage(f"Unrecognized option '{token}'")
+                name = candidates[0]
+            if sep and (name not in self._optiondict or not self._optiondict[name][2]):
+                # Help and boolean flags cannot carry an inline value
+                raise Usage(f"Option '{name}' does not take an argument")
+            return [(name, value if sep else None)]
+
+        if (len(token) > 2 and token[0] == "-"
+                and all(char in self._bundled for char in token[1:])):
+            return [("-" + char, None) for char in token[1:]]
+
+        raise Usage(f"Unrecognized option '{token}'")
+
     def parse(self, args, ignore_help=False):
         """Parse a list of command-line argument strings.
 
-        Arguments are consumed left to right.  Each flag is looked up in the
-        option dict; the appropriate number of following tokens is consumed
-        and converted using the option's type callable.  The original list is
-        not modified.
+        Arguments are consumed left to right in a single pass.  Each flag is
+        resolved by :meth:`_resolve`; the appropriate number of following
+        tokens is consumed and converted using the option's type callable.
+        The original list is not modified.
 
         Special cases:
 
@@ -418,6 +510,9 @@ class Options:
         - MULTI options append each occurrence to a list rather than
           overwriting.
         - When ``nargs > 1`` the values are stored as a tuple.
+        - ``--flag=value`` supplies the first argument inline, long flags
+          may be abbreviated to any unambiguous prefix, and single-character
+          boolean flags may be bundled (``-vq``).
 
         Parameters
         ----------
@@ -442,61 +537,67 @@ class Options:
             If ``-h`` or ``--help`` is encountered and ``ignore_help`` is
             False.
         Usage
-            If an unrecognised flag is encountered, or a flag does not
-            receive enough arguments, or a type conversion fails.
+            If an unrecognised or ambiguous flag is encountered, or a flag
+            does not receive enough arguments, or a type conversion fails.
         MissingMandatoryError
             If any MANDATORY option was absent from the argument list.
         """
         options = self.default_dict()
         seen = set()
 
-        # Work on a shallow copy so the caller's list is not modified.
+        # Walk the arguments by index; the caller's list is never modified.
         # The original may be needed for display purposes (e.g. self.args).
-        args = copy.copy(args)
-
-        while args:
-            opt = args.pop(0)
-            seen.add(opt)
-
-            if opt in ("--help", "-h"):
-                if ignore_help:
-                    continue
-                raise SimoptHelp
-
-            if opt not in self._optiondict:
-                raise Usage(f"Unrecognized option '{opt}'")
-
-            attr, typ, num, default, flags, description = self._optiondict[opt]
-
-            if num > len(args):
-                raise Usage(f"Option '{opt}' requires {num} arguments")
-
-            if num:
-                # Consume the next token and apply the type converter.
-                # For nargs > 1 the same converter is applied to each token
-                # (multi-argument options with mixed types are not supported).
-                a = args.pop(0)
-                try:
-                    val = [typ(a) for i in range(num)]
-                except ValueError as exc:
-                    raise Usage(f"Invalid argument to option '{opt}': {repr(a)}") from exc
-            else:
-                # Boolean flag: no argument consumed
-                val = [True]
-
-            if typ == bool:
-                # Boolean options are simply set to True; the default (False)
-                # is already in place from default_dict().
-                options[attr] = True
-            elif flags & MULTI:
-                # Repeatable option: accumulate into a list.
-                # Single-argument options append the value directly;
-                # multi-argument options append a tuple.
-                options[attr] = options.get(attr, [])
-                options[attr].append(val[0] if num == 1 else tuple(val))
-            else:
-                # Standard option: last occurrence wins.
-                options[attr] = val[0] if num == 1 else tuple(val)
+        i = 0
+        while i < len(args):
+            token = args[i]
+            i += 1
+
+            for opt, inline in self._resolve(token):
+                seen.add(opt)
+
+                if opt in ("--help", "-h"):
+                    if ignore_help:
+                        continue
+                    raise SimoptHelp
+
+                attr, typ, num, default, flags, description = self._optiondict[opt]
+
+                if inline is not None:
+                    # --flag=value: the inline value is the first argument
+                    values = [inline, *args[i:i + num - 1]]
+                else:
+                    values = list(args[i:i + num])
+                i += len(values) - (inline is not None)
+
+                if len(values) < num:
+                    raise Usage(f"Option '{opt}' requires {num} arguments")
+
+                if num:
+                    # Apply the type converter to each consumed token.
+                    # Multi-argument options with mixed types are not supported.
+                    val = []
+                    for a in values:
+                        try:
+                            val.append(typ(a))
+                        except ValueError as exc:
+                            raise Usage(f"Invalid argument to option '{opt}': {repr(a)}") from exc
+                else:
+                    # Boolean flag: no argument consumed
+                    val = [True]
+
+                if typ == bool:
+                    # Boolean options are simply set to True; the default (False)
+                    # is already in place from default_dict().
+                    options[attr] = True
+                elif flags & MULTI:
+                    # Repeatable option: accumulate into a list.
+                    # Single-argument options append the value directly;
+                    # multi-argument options append a tuple.
+                    options[attr] = options.get(attr, [])
+                    options[attr].append(val[0] if num == 1 else tuple(val))
+                else:
+                    # Standard option: last occurrence wins.
+                    options[attr] = val[0] if num == 1 else tuple(val)
 
         # Check that every mandatory flag was seen at least once.
         # We collect all missing flags before raising so the user sees
@@ -613,6 +714,10 @@ def opt_func(options, check_mandatory=True):
     #   @opt_func(options)          → calls opt_func → returns validate_arguments
     #   def process(**arguments):   → validate_arguments(process) → returns wrap
     #   process(output="x")         → calls wrap → fills defaults → calls process
+    #
+    # functools is imported here, not at module level, to keep importing
+    # simopt cheap for the common case of parsing without decorators.
+    import functools
 
     def validate_arguments(func):
         @functools.wraps(func)
@@ -0,0 +1,111 @@
+"""Import-time budget for simopt.
+
+simopt is imported at the start of every job, so importing it should do
+no file I/O and pull in no modules beyond what the interpreter already
+loaded.  Each test runs in a fresh interpreter to see a cold import.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Maximum ratio between the self-time of simopt and that of an empty
+# reference module imported in the same run, both from cached bytecode.
+# Over repeated runs the ratio measured between 1.3 and 2.1 when this test
+# was written, so a limit of 4 allows for noise but fails if the work done
+# at import roughly doubles.  A single file read costs too little to show
+# up here; file access and new imports are checked directly by
+# test_version_read_lazily and test_import_pulls_in_no_modules.
+FACTOR = 4
+
+REFERENCE = "_simopt_reference"
+
+
+def run_python(pycache, *args, path=ROOT):
+    """Run a fresh interpreter with simopt importable and return the result.
+
+    Bytecode is cached under ``pycache`` rather than in the source tree.
+    """
+    env = dict(os.environ, PYTHONPATH=path, PYTHONPYCACHEPREFIX=str(pycache))
+    return subprocess.run(
+        [sys.executable, *args],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def importtime(tmp_path_factory):
+    """Return the self-times of simopt and the reference module, and the
+    modules imported by simopt, as reported by ``-X importtime``."""
+    refdir = tmp_path_factory.mktemp("reference")
+    reference = refdir / f"{REFERENCE}.py"
+    reference.write_text('"""Empty module to time imports against."""\n')
+    pycache = tmp_path_factory.mktemp("pycache")
+    path = os.pathsep.join([ROOT, str(refdir)])
+
+    # Compile beforehand so that compilation is not counted.  py_compile
+    # writes the cache even when PYTHONDONTWRITEBYTECODE is set.
+    run_python(pycache, "-m", "py_compile",
+               os.path.join(ROOT, "simopt.py"), str(reference))
+    stderr = run_python(
+        pycache, "-X", "importtime", "-c", f"import {REFERENCE}, simopt", path=path,
+    ).stderr
+
+    # Lines read "import time: self | cumulative | name", where the name is
+    # indented by nesting depth and nested imports precede their parent.
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        selftime, _, name = line[len("import time:"):].split("|")
+        if not selftime.strip().isdigit():
+            continue  # header line
+        depth = len(name) - len(name.lstrip())
+        entries.append((int(selftime), depth, name.strip()))
+
+    times = {name: selftime for selftime, _, name in entries}
+    for index, (selftime, depth, name) in enumerate(entries):
+        if name == "simopt":
+            children = []
+            for _, child_depth, child in reversed(entries[:index]):
+                if child_depth <= depth:
+                    break
+                children.append(child)
+            return times["simopt"], times[REFERENCE], set(children)
+    pytest.fail("simopt not found in -X importtime output")
+
+
+def test_import_pulls_in_no_modules(importtime):
+    _, _, children = importtime
+    assert not children
+
+
+def test_import_within_budget(importtime):
+    selftime, reference, _ = importtime
+    assert selftime < FACTOR * reference
+
+
+def test_version_read_lazily(tmp_path):
+    code = "\n".join([
+        "import builtins",
+        "opened = []",
+        "real_open = builtins.open",
+        "def spy(file, *args, **kwargs):",
+        "    opened.append(str(file))",
+        "    return real_open(file, *args, **kwargs)",
+        "builtins.open = spy",
+        "import simopt",
+        "print(any(f.endswith('VERSION.txt') for f in opened))",
+        "version = simopt.__version__",
+        "print(any(f.endswith('VERSION.txt') for f in opened))",
+        "print(version)",
+    ])
+    before, after, version = run_python(tmp_path, "-c", code).stdout.split()
+    assert before == "False"
+    assert after == "True"
+    with open(os.path.join(ROOT, "VERSION.txt"), encoding="UTF-8") as infile:
+        assert version == infile.readline().strip()
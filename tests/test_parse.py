@@ -0,0 +1,72 @@
+"""Resolution of long, abbreviated, inline and bundled flags in parse."""
+
+import pytest
+
+from simopt import Options, SimoptHelp, Usage, MULTI
+
+OPTIONS = [
+    (0, "--output",  "output",  str,   1, "out",  0,     "Output file"),
+    (0, "--outdir",  "outdir",  str,   1, ".",    0,     "Output directory"),
+    (0, "--pair",    "pair",    int,   2, None,   MULTI, "Pair of indices"),
+    (0, "--verbose", "verbose", bool,  0, False,  0,     "Verbose output"),
+    (0, "-dt",       "dt",      float, 1, 0.002,  0,     "Time step (ps)"),
+    (0, "-d",        "debug",   bool,  0, False,  0,     "Debug output"),
+    (0, "-t",        "test",    bool,  0, False,  0,     "Test mode"),
+    (0, "-v",        "v",       bool,  0, False,  0,     "Verbose"),
+    (0, "-q",        "quiet",   bool,  0, False,  0,     "Quiet"),
+]
+
+
+@pytest.fixture
+def opt():
+    return Options(OPTIONS)
+
+
+def test_inline_value_with_prefix(opt):
+    assert opt.parse(["--outp=a"])["output"] == "a"
+
+
+def test_ambiguous_prefix_lists_candidates(opt):
+    with pytest.raises(Usage) as excinfo:
+        opt.parse(["--out", "a"])
+    assert "--outdir" in str(excinfo.value)
+    assert "--output" in str(excinfo.value)
+
+
+def test_bundled_booleans(opt):
+    parsed = opt.parse(["-vq"])
+    assert parsed["v"] is True
+    assert parsed["quiet"] is True
+
+
+def test_exact_match_is_not_a_bundle(opt):
+    parsed = opt.parse(["-dt", "3"])
+    assert parsed["dt"] == 3.0
+    assert parsed["debug"] is False
+    assert parsed["test"] is False
+
+
+def test_multiple_arguments_consume_tokens(opt):
+    assert opt.parse(["--pair", "1", "2"])["pair"] == [(1, 2)]
+    assert opt.parse(["--pair=1", "2"])["pair"] == [(1, 2)]
+
+
+def test_inline_value_with_too_few_arguments(opt):
+    with pytest.raises(Usage):
+        opt.parse(["--pair=1"])
+
+
+def test_inline_value_on_boolean_rejected(opt):
+    with pytest.raises(Usage):
+        opt.parse(["--verbose=1"])
+
+
+def test_inline_value_on_help_rejected(opt):
+    with pytest.raises(Usage):
+        opt.parse(["--help=foo"])
+
+
+def test_user_defined_help_prefix():
+    opt = Options([(0, "--help", "help", bool, 0, False, 0, "Help")])
+    with pytest.raises(SimoptHelp):
+        opt.parse(["--hel"])